@@ -15,18 +15,14 @@ __version__ = "0.1.0"
 # Main API exports
 from revo_norm.text_normalizer import (
     normalize_text,
+    normalize_text_batch,
     normalize_whitespace,
     email_to_spoken,
     expand_capitalized_initialisms,
     split_into_sentences,
+    clear_cache,
 )
 
-# English normalizer
-from revo_norm.normalizer_en import text_normalize as normalize_english
-
-# Malay normalizer
-from revo_norm.normalizer_ms import normalize_malay as normalize_malay
-
 # Number to words (Malay)
 from revo_norm.num2word import to_cardinal, to_ordinal, to_currency, to_year
 
@@ -35,10 +31,12 @@ __all__ = [
     "__version__",
     # Main API
     "normalize_text",
+    "normalize_text_batch",
     "normalize_whitespace",
     "email_to_spoken",
     "expand_capitalized_initialisms",
     "split_into_sentences",
+    "clear_cache",
     # Language-specific normalizers
     "normalize_english",
     "normalize_malay",
@@ -48,3 +46,24 @@ __all__ = [
     "to_currency",
     "to_year",
 ]
+
+
+# Language-specific normalizers are imported on first access (PEP 562) so
+# importing the package does not compile every language's patterns
+_LAZY_NORMALIZERS = {
+    "normalize_english": "en",
+    "normalize_malay": "ms",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_NORMALIZERS:
+        from revo_norm.text_normalizer import _language_normalizer
+
+        normalizer = globals()[name] = _language_normalizer(_LAZY_NORMALIZERS[name])
+        return normalizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NORMALIZERS))
@@ -0,0 +1,26 @@
+class SpellingTable(dict):
+    """
+    ``str.translate`` table for spelling tokens out character by character.
+
+    Characters missing from ``mapping`` are resolved through ``fallback`` the
+    first time they are seen and memoized, so the common ASCII path stays
+    entirely inside ``str.translate``.
+
+    Example:
+        >>> table = SpellingTable({ord('1'): ' one'}, lambda ch: ' ' + ch.upper())
+        >>> 'a1'.translate(table).lstrip()
+        'A one'
+    """
+
+    def __init__(self, mapping, fallback):
+        super().__init__(mapping)
+        self._fallback = fallback
+
+    def __missing__(self, key):
+        value = self[key] = self._fallback(chr(key))
+        return value
+
+
+def spelled(words):
+    """Build a translate mapping of ``{ord(char): ' ' + word}`` from ``{char: word}``."""
+    return {ord(char): ' ' + word for char, word in words.items()}
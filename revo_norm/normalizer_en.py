@@ -1,7 +1,75 @@
 import re
-import inflect
+from functools import lru_cache
+
+from revo_norm._translate import SpellingTable, spelled
+
+# Hand-rolled number words for 0-9999, the range TTS text actually uses.
+# The output matches inflect's number_to_words; larger numbers still go
+# through inflect, which is only imported on first use.
+_ones_en = (
+    'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine',
+    'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen',
+    'seventeen', 'eighteen', 'nineteen',
+)
+_tens_en = (
+    '', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety',
+)
+_irregular_ordinals_en = {
+    'one': 'first', 'two': 'second', 'three': 'third', 'five': 'fifth',
+    'eight': 'eighth', 'nine': 'ninth', 'twelve': 'twelfth',
+}
+_fast_path_limit = 10000
+
+
+@lru_cache(maxsize=None)
+def _inflect_engine():
+    import inflect
+    return inflect.engine()
 
-_inflect = inflect.engine()
+
+def _small_number_to_words(number):
+    """Spell 0 <= number < 10000 the way inflect does."""
+    if number < 20:
+        return _ones_en[number]
+    if number < 100:
+        tens, ones = divmod(number, 10)
+        return _tens_en[tens] + '-' + _ones_en[ones] if ones else _tens_en[tens]
+    if number < 1000:
+        hundreds, rest = divmod(number, 100)
+        words = _ones_en[hundreds] + ' hundred'
+    else:
+        thousands, rest = divmod(number, 1000)
+        words = _small_number_to_words(thousands) + ' thousand'
+        if rest >= 100:
+            return words + ', ' + _small_number_to_words(rest)
+    return words + ' and ' + _small_number_to_words(rest) if rest else words
+
+
+@lru_cache(maxsize=8192)
+def _number_to_words(number):
+    """Cached cardinal words; TTS text repeats the same numbers a lot."""
+    if 0 <= number < _fast_path_limit:
+        return _small_number_to_words(number)
+    return _inflect_engine().number_to_words(number)
+
+
+@lru_cache(maxsize=128)
+def _ordinal_to_words(number):
+    """Cached ordinal words (e.g. 21 -> 'twenty-first')."""
+    if not 0 <= number < _fast_path_limit:
+        engine = _inflect_engine()
+        return engine.number_to_words(engine.ordinal(number))
+    words = _small_number_to_words(number)
+    split = max(words.rfind(' '), words.rfind('-')) + 1
+    head, last = words[:split], words[split:]
+    if last in _irregular_ordinals_en:
+        return head + _irregular_ordinals_en[last]
+    if last.endswith('y'):
+        return head + last[:-1] + 'ieth'
+    return head + last + 'th'
+
+
+_digit_words = tuple(_number_to_words(i) for i in range(10))
 
 # Mappings
 numbers_mapping_en = {
@@ -10,9 +78,19 @@ numbers_mapping_en = {
     '8': 'eight', '9': 'nine', '+': 'plus'
 }
 
-contractions_en = [
-    (re.compile(r"\b%s\b" % re.escape(x[0]), re.IGNORECASE), x[1])
-    for x in [
+# str.translate tables for spelling tokens out one character at a time
+_spell_digits_en = SpellingTable(
+    {**spelled(numbers_mapping_en), ord('-'): ' dash'},
+    lambda ch: ' ' + (_digit_words[int(ch)] if ch.isdecimal() else ch)
+)
+_spell_alnum_en = SpellingTable(
+    spelled(dict(zip('0123456789', _digit_words))),
+    lambda ch: ' ' + ch.upper() if ch.isalnum() else ''
+)
+
+contractions_en = {
+    k.lower(): v
+    for k, v in [
         ("I'm", "I am"), ("I've", "I have"), ("I'll", "I will"), ("I'd", "I would"),
         ("you're", "you are"), ("you've", "you have"), ("you'll", "you will"), ("you'd", "you would"),
         ("he's", "he is"), ("he'll", "he will"), ("he'd", "he would"),
@@ -38,11 +116,10 @@ contractions_en = [
         ("shall've", "shall have"), ("will've", "will have"), ("might've", "might have"),
         ("must've", "must have")
     ]
-]
+}
 
-abbreviations_en = [
-    (re.compile("\\b%s\\." % x[0], re.IGNORECASE), x[1])
-    for x in [
+abbreviations_en = dict(
+    [
         ("mrs", "misess"),
         ("mr", "mister"),
         ("dr", "doctor"),
@@ -62,7 +139,42 @@ abbreviations_en = [
         ("col", "colonel"),
         ("ft", "fort"),
     ]
-]
+)
+
+
+def _first_char_lookahead(*word_sets):
+    return "(?=[%s])" % re.escape("".join(sorted({key[0] for words in word_sets for key in words})))
+
+
+def _alternation_re(words, template):
+    """
+    Compile the keys of ``words`` into one alternation with a group per key.
+
+    Keys go longest first so 'mrs' wins over 'mr'. Returns the pattern and
+    the replacements in group order; callers pick the replacement with
+    m.lastindex, because re.IGNORECASE also matches characters such as 'ſ'
+    and 'ı' whose lowercase form is not a key.
+    """
+    ordered = sorted(words.items(), key=lambda item: len(item[0]), reverse=True)
+    # Each key's first character stays outside its group: sre rejects a
+    # branch on a mismatched leading literal, but not on one that opens with
+    # a group. The lookahead lets the scan skip other starting characters.
+    alternation = "|".join(f"{re.escape(key[0])}({re.escape(key[1:])})" for key, _ in ordered)
+    pattern = _first_char_lookahead(words) + template % alternation
+    return re.compile(pattern, re.IGNORECASE), [word for _, word in ordered]
+
+
+_contractions_en_re, _contraction_words = _alternation_re(contractions_en, r"\b(?:%s)\b")
+_abbreviations_en_re, _abbreviation_words = _alternation_re(abbreviations_en, r"\b(?:%s)\.")
+# Contractions and abbreviations in one scan. The abbreviation groups follow
+# the contraction groups, so m.lastindex indexes the concatenated word lists
+_words_en_re = re.compile(
+    _first_char_lookahead(contractions_en, abbreviations_en)
+    + "(?:%s|%s)" % (_contractions_en_re.pattern, _abbreviations_en_re.pattern),
+    re.IGNORECASE
+)
+_words_en = _contraction_words + _abbreviation_words
+
 months_en = {
     '01': 'January', '1': 'January', '02': 'February', '2': 'February',
     '03': 'March', '3': 'March', '04': 'April', '4': 'April',
@@ -72,38 +184,60 @@ months_en = {
     '11': 'November', '12': 'December'
 }
 
+# Currency symbol (upper-cased) -> (main unit, sub unit)
+currency_units_en = {
+    'RM': ('ringgit', 'cent'),
+    'MYR': ('ringgit', 'cent'),
+    '$': ('dollar', 'cent'),
+    'USD': ('dollar', 'cent'),
+    '£': ('pound', 'pence'),
+    '€': ('euro', 'cent'),
+}
+
 # Regex patterns
-_currency_re = re.compile(r'\b(RM|\$|£|€|USD|EUR|GBP|MYR)\s?([\d,]+(?:[\.,]\d{1,2})?)\b', re.IGNORECASE)
-_percentage_re = re.compile(r'\b(\d+(?:\.\d+)?)%')
-_decimal_re = re.compile(r'\b(\d+)\.(\d+)\b')
-_dashed_digit_re = re.compile(r'(?<![A-Za-z])([+\d]+(?:-[\d]+)+)(?![A-Za-z])')
-_ordinal_re = re.compile(r'\b(\d{1,2})(st|nd|rd|th)\b', re.IGNORECASE)
+# Capturing groups are named with a per-pattern prefix so the patterns can be
+# combined into a single alternation (see _numeric_re below). Letters are
+# matched with explicit [Xx] classes rather than re.IGNORECASE, which makes
+# sre case-fold every character it compares.
+_currency_re = re.compile(r'\b(?P<curr_symbol>[Rr][Mm]|\$|£|€|[Uu][Ss][Dd]|[Ee][Uu][Rr]|[Gg][Bb][Pp]|[Mm][Yy][Rr])\s?(?P<curr_amount>[\d,]+(?:[\.,]\d{1,2})?)\b')
+_percentage_re = re.compile(r'\b(?P<pct_number>\d+(?:\.\d+)?)%')
+_decimal_re = re.compile(r'\b(?P<dec_whole>\d+)\.(?P<dec_frac>\d+)\b')
+_dashed_digit_re = re.compile(r'(?<![A-Za-z])(?P<dashed_raw>[+\d]+(?:-[\d]+)+)(?![A-Za-z])')
+_ordinal_re = re.compile(r'\b(?P<ord_number>\d{1,2})(?P<ord_suffix>[Ss][Tt]|[Nn][Dd]|[Rr][Dd]|[Tt][Hh])\b')
 _mixed_alnum_re = re.compile(r'\b(?=\w*\d)(?=\w*[A-Za-z])[\w\-]+\b')
 _number_re = re.compile(r'\b\d+\b')
-_number_with_commas_re = re.compile(r'\b\d{1,3}(?:,\d{3})+\b')
-_date_re = re.compile(r'\b(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{2,4})\b')
-_time_re = re.compile(r'\b(\d{1,2})[:\.](\d{2})\s*(?:(am|pm|a\.m\.|p\.m\.))', re.IGNORECASE)
-_time_no_meridian_re = re.compile(r'\b(\d{1,2})[:\.](\d{2})\b(?!\s*(?:am|pm|a\.m\.|p\.m\.))(?!.*%)', re.IGNORECASE)
-
-# Create ignore words set
-IGNORE_WORDS = set()
-for i in range(1, 32):
-    IGNORE_WORDS.add(_inflect.number_to_words(i))
-    ordinal_word = _inflect.number_to_words(_inflect.ordinal(i))
-    IGNORE_WORDS.add(ordinal_word)
+_number_with_commas_re = re.compile(r'\b(?P<comma_whole>\d{1,3}(?:,\d{3})+)(?:\.(?P<comma_frac>\d+))?\b')
+_date_re = re.compile(r'\b(?P<date_day>\d{1,2})[\/\-\.](?P<date_month>\d{1,2})[\/\-\.](?P<date_year>\d{2,4})\b')
+_time_re = re.compile(r'\b(?P<time_hour>\d{1,2})[:\.](?P<time_minute>\d{2})\s*(?:(?P<time_meridian>[AaPp][Mm]|[AaPp]\.[Mm]\.))')
+_time_no_meridian_re = re.compile(r'\b(?P<tnm_hour>\d{1,2})[:\.](?P<tnm_minute>\d{2})\b(?!\s*(?:[AaPp][Mm]|[AaPp]\.[Mm]\.))(?!.*%)')
+
+# Cardinal and ordinal words for 1-31, spelled out here rather than generated
+# through inflect at import time
+IGNORE_WORDS = frozenset({
+    'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+    'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen',
+    'eighteen', 'nineteen', 'twenty', 'twenty-one', 'twenty-two', 'twenty-three',
+    'twenty-four', 'twenty-five', 'twenty-six', 'twenty-seven', 'twenty-eight',
+    'twenty-nine', 'thirty', 'thirty-one',
+    'first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'seventh', 'eighth', 'ninth',
+    'tenth', 'eleventh', 'twelfth', 'thirteenth', 'fourteenth', 'fifteenth', 'sixteenth',
+    'seventeenth', 'eighteenth', 'nineteenth', 'twentieth', 'twenty-first',
+    'twenty-second', 'twenty-third', 'twenty-fourth', 'twenty-fifth', 'twenty-sixth',
+    'twenty-seventh', 'twenty-eighth', 'twenty-ninth', 'thirtieth', 'thirty-first',
+})
 
 
 def normalize_mixed_alnum(m):
     token = m.group(0)
     if token.lower() in IGNORE_WORDS:
         return token
-    return ' '.join(numbers_mapping_en.get(c, c.upper()) for c in token if c.isalnum())
+    return token.translate(_spell_alnum_en).lstrip()
 
 
 def normalize_time(m):
-    hour, minute, meridian = m.groups()
-    hour_word = _inflect.number_to_words(int(hour))
-    minute_word = _inflect.number_to_words(int(minute))
+    hour, minute, meridian = m.group('time_hour', 'time_minute', 'time_meridian')
+    hour_word = _number_to_words(int(hour))
+    minute_word = _number_to_words(int(minute))
 
     meridian_word = ''
     if meridian:
@@ -117,7 +251,7 @@ def normalize_time(m):
 
 def normalize_time_no_meridian(m):
     """Normalize time without meridian (e.g., 17:30, 09:00)."""
-    hour, minute = m.groups()
+    hour, minute = m.group('tnm_hour', 'tnm_minute')
     hour_int = int(hour)
     minute_int = int(minute)
 
@@ -128,8 +262,8 @@ def normalize_time_no_meridian(m):
     if hour_int == 12 and minute_int == 0:
         return "noon"
 
-    hour_word = _inflect.number_to_words(hour_int)
-    minute_word = _inflect.number_to_words(minute_int)
+    hour_word = _number_to_words(hour_int)
+    minute_word = _number_to_words(minute_int)
 
     if minute_word == 'zero':
         return hour_word
@@ -139,122 +273,174 @@ def normalize_time_no_meridian(m):
 
 def expand_contractions(text, lang="en"):
     if lang == "en":
-        _contractions = contractions_en
+        _words, _regex = _contraction_words, _contractions_en_re
     else:
         raise NotImplementedError()
-    for regex, replacement in _contractions:
-        text = re.sub(regex, replacement, text)
-    return text
+    return _regex.sub(lambda m: _words[m.lastindex - 1], text)
 
 
 def expand_abbreviations(text, lang="en"):
     if lang == "en":
-        _abbreviations = abbreviations_en
+        _words, _regex = _abbreviation_words, _abbreviations_en_re
     else:
         raise NotImplementedError()
-    for regex, replacement in _abbreviations:
-        text = re.sub(regex, replacement, text)
-    return text
+    return _regex.sub(lambda m: _words[m.lastindex - 1], text)
+
+
+def _expand_word(m):
+    return _words_en[m.lastindex - 1]
+
+
+_drop_plus_dash = str.maketrans('', '', '+-')
 
 
 def is_mixed_alnum(token):
-    return any(c.isalpha() for c in token) and any(c.isdigit() for c in token)
+    # Single pass that stops as soon as both a letter and a digit were seen
+    has_alpha = has_digit = False
+    for c in token:
+        if c.isalpha():
+            has_alpha = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_alpha and has_digit:
+            return True
+    return False
 
 
 def is_only_digits_and_dashes(token):
-    return all(c.isdigit() or c in '+-' for c in token.replace('-', ''))
+    rest = token.translate(_drop_plus_dash)
+    return not rest or rest.isdigit()
 
 
 def normalize_date(m):
-    day, month, year = m.groups()
-    month_name = months_en.get(month.lstrip('0'), month)
-    day_word = _inflect.number_to_words(_inflect.ordinal(int(day)))
-    year_word = _inflect.number_to_words(int(year), andword='and')
+    day, month, year = m.group('date_day', 'date_month', 'date_year')
+    # months_en has both padded and unpadded keys; out-of-range months are
+    # spelled out like any other number
+    month_name = months_en.get(month) or _number_to_words(int(month))
+    day_word = _ordinal_to_words(int(day))
+    year_word = _number_to_words(int(year))
     return f"{day_word} of {month_name}, {year_word}"
 
 
 def normalize_currency(m):
-    symbol, amount = m.groups()
+    symbol, amount = m.group('curr_symbol', 'curr_amount')
     amount = amount.replace(",", "")
-    if symbol.upper() == 'RM':
-        unit_main, unit_sub = 'ringgit', 'cent'
-    elif symbol.upper() == 'MYR':
-        unit_main, unit_sub = 'ringgit', 'cent'
-    elif symbol == '$':
-        unit_main, unit_sub = 'dollar', 'cent'
-    elif symbol == '£':
-        unit_main, unit_sub = 'pound', 'pence'
-    elif symbol == '€':
-        unit_main, unit_sub = 'euro', 'cent'
-    elif symbol == 'USD':
-        unit_main, unit_sub = 'dollar', 'cent'
-    else:
-        unit_main, unit_sub = 'unit', 'subunit'
+    unit_main, unit_sub = currency_units_en.get(symbol.upper(), ('unit', 'subunit'))
 
     if '.' in amount:
         major, minor = amount.split('.')
         if minor != '00':
-            return f"{_inflect.number_to_words(int(major))} {unit_main} {_inflect.number_to_words(int(minor[:2]))} {unit_sub}"
+            return f"{_number_to_words(int(major))} {unit_main} {_number_to_words(int(minor[:2]))} {unit_sub}"
         else:
-            return f"{_inflect.number_to_words(int(major))} {unit_main}"
+            return f"{_number_to_words(int(major))} {unit_main}"
     else:
-        return f"{_inflect.number_to_words(int(amount))} {unit_main}"
+        return f"{_number_to_words(int(amount))} {unit_main}"
 
 
 def normalize_percentage(m):
-    number = m.group(1)
+    number = m.group('pct_number')
     if '.' in number:
         whole, frac = number.split('.')
-        frac_words = ' '.join(_inflect.number_to_words(int(digit)) for digit in frac)
-        return f"{_inflect.number_to_words(int(whole))} point {frac_words} percent"
+        frac_words = frac.translate(_spell_digits_en).lstrip()
+        return f"{_number_to_words(int(whole))} point {frac_words} percent"
     else:
-        return f"{_inflect.number_to_words(int(number))} percent"
+        return f"{_number_to_words(int(number))} percent"
+
+
+def _decimal_words(whole, frac):
+    # Fraction digits are spoken one at a time
+    frac_words = frac.translate(_spell_digits_en).lstrip()
+    return f"{_number_to_words(whole)} point {frac_words}"
 
 
 def normalize_decimal(m):
-    whole, frac = m.group(1), m.group(2)
-    frac_words = ' '.join(_inflect.number_to_words(int(digit)) for digit in frac)
-    return f"{_inflect.number_to_words(int(whole))} point {frac_words}"
+    whole, frac = m.group('dec_whole', 'dec_frac')
+    return _decimal_words(int(whole), frac)
 
 
 def normalize_dashed_digits(m):
-    raw = m.group(1)
-    return ' '.join(numbers_mapping_en.get(ch, ch) if ch != '-' else 'dash' for ch in raw)
+    return m.group('dashed_raw').translate(_spell_digits_en).lstrip()
 
 
 def normalize_ordinal(m):
-    number = int(m.group(1))
-    return _inflect.number_to_words(_inflect.ordinal(number))
+    number = int(m.group('ord_number'))
+    return _ordinal_to_words(number)
 
 
 def normalize_number(m):
     if len(m.group(0)) > 4:
-        return ' '.join(_inflect.number_to_words(int(digit)) for digit in m.group(0))
+        return m.group(0).translate(_spell_digits_en).lstrip()
     else:
-        return _inflect.number_to_words(int(m.group(0)))
+        return _number_to_words(int(m.group(0)))
 
 
 def normalize_number_with_commas(m):
-    """Normalize numbers with commas like 1,000,000 or 7,832."""
-    num_str = m.group(0).replace(',', '')
-    num = int(num_str)
-    return _inflect.number_to_words(num)
+    """Normalize numbers with commas like 1,000,000, 7,832 or 1,234.56."""
+    whole, frac = m.group('comma_whole', 'comma_frac')
+    num = int(whole.replace(',', ''))
+    if frac is not None:
+        return _decimal_words(num, frac)
+    return _number_to_words(num)
+
+
+def _pattern_source(*regexes):
+    """Alternation of the regexes' sources with named groups made non-capturing."""
+    return '|'.join(re.sub(r'\(\?P<\w+>', '(?:', regex.pattern) for regex in regexes)
+
+
+# In one leftmost-first scan a decimal or dashed number that starts further
+# left would swallow the start of a higher-priority match ("10-20%",
+# "9-5:30 pm", "1.2.3.4:80"). These variants refuse to continue into a digit
+# run where a higher-priority pattern matches, like the ordered passes did.
+_decimal_scan_re = re.compile(
+    r'\b(?P<dec_whole>\d+)\.(?!%s)(?P<dec_frac>\d+)\b'
+    % _pattern_source(_time_no_meridian_re, _time_re, _percentage_re)
+)
+_dashed_digit_scan_re = re.compile(
+    r'(?<![A-Za-z])(?P<dashed_raw>[+\d]+(?:-(?!%s)[\d]+)+)(?![A-Za-z])'
+    % _pattern_source(_time_no_meridian_re, _time_re, _percentage_re, _decimal_re)
+)
+
+# Dates have the highest priority and get their own pass: in one alternation
+# an earlier-starting dashed number would swallow them ("+60-12-345-6789").
+# The remaining passes in priority order; earlier entries win when several
+# patterns match at the same position.
+_numeric_passes = [
+    ('currency', _currency_re, normalize_currency),
+    ('time_no_meridian', _time_no_meridian_re, normalize_time_no_meridian),
+    ('time', _time_re, normalize_time),
+    ('percentage', _percentage_re, normalize_percentage),
+    ('decimal', _decimal_scan_re, normalize_decimal),
+    ('dashed_digits', _dashed_digit_scan_re, normalize_dashed_digits),
+    ('ordinal', _ordinal_re, normalize_ordinal),
+    ('number_with_commas', _number_with_commas_re, normalize_number_with_commas),
+    ('number', _number_re, normalize_number),
+]
+# Every alternative starts with a digit, '+' (dashed numbers) or the first
+# character of a currency symbol. The lookahead lets the engine skip other
+# positions instead of trying all nine alternatives at each one.
+_numeric_re = re.compile(
+    r'(?=[\d+$£€RrMmUuEeGg])(?:%s)'
+    % '|'.join(f'(?P<{name}>{regex.pattern})' for name, regex, _ in _numeric_passes)
+)
+_numeric_handlers = {name: handler for name, _, handler in _numeric_passes}
+_digit_re = re.compile(r'\d')
+
+
+def _dispatch_numeric(m):
+    return _numeric_handlers[m.lastgroup](m)
 
 
+@lru_cache(maxsize=4096)
 def text_normalize(text: str) -> str:
     """Main English text normalization function."""
-    text = re.sub(_date_re, normalize_date, text)
-    text = re.sub(_currency_re, normalize_currency, text)
-    text = re.sub(_time_no_meridian_re, normalize_time_no_meridian, text)
-    text = re.sub(_time_re, normalize_time, text)
-    text = re.sub(_percentage_re, normalize_percentage, text)
-    text = re.sub(_decimal_re, normalize_decimal, text)
-    text = re.sub(_dashed_digit_re, normalize_dashed_digits, text)
-    text = re.sub(_ordinal_re, normalize_ordinal, text)
-    text = re.sub(_number_with_commas_re, normalize_number_with_commas, text)
-    text = re.sub(_number_re, normalize_number, text)
-    text = re.sub(_mixed_alnum_re, normalize_mixed_alnum, text)
-    text = expand_contractions(text)
-    text = expand_abbreviations(text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    # Every numeric and mixed-alnum pattern needs a digit; skip both scans on
+    # plain prose
+    if _digit_re.search(text):
+        text = _date_re.sub(normalize_date, text)
+        text = _numeric_re.sub(_dispatch_numeric, text)
+        text = _mixed_alnum_re.sub(normalize_mixed_alnum, text)
+    text = _words_en_re.sub(_expand_word, text)
+    return ' '.join(text.split())
@@ -1,7 +1,14 @@
 import re
+import string
+from functools import lru_cache
 from typing import Dict
 import os
-from revo_norm.num2word import to_cardinal as num2word
+from revo_norm._translate import SpellingTable, spelled
+from revo_norm.num2word import to_cardinal
+
+# Cached cardinal; TTS text repeats the same numbers a lot. Typed so that 1
+# and 1.0 ('satu' vs 'satu perpuluhan kosong') get separate entries
+num2word = lru_cache(maxsize=8192, typed=True)(to_cardinal)
 
 
 numbers_mapping_malay = {
@@ -9,6 +16,17 @@ numbers_mapping_malay = {
     '4': 'empat', '5': 'lima', '6': 'enam', '7': 'tujuh',
     '8': 'lapan', '9': 'sembilan'
 }
+_digit_words = tuple(num2word(i) for i in range(10))
+
+# str.translate tables for spelling tokens out one character at a time
+_spell_digits_ms = SpellingTable(
+    spelled(numbers_mapping_malay),
+    lambda ch: ' ' + _digit_words[int(ch)] if ch.isdecimal() else ''
+)
+_spell_alnum_ms = SpellingTable(
+    spelled(numbers_mapping_malay),
+    lambda ch: ' ' + ch.upper() if ch.isalnum() else ''
+)
 
 _months = {
     '01': 'Januari', '1': 'Januari', '02': 'Februari', '2': 'Februari',
@@ -19,44 +37,95 @@ _months = {
     '11': 'November', '12': 'Disember'
 }
 
+# Currency symbol (upper-cased) -> (main unit, sub unit)
+_currency_units = {
+    'RM': ('ringgit', 'sen'),
+    'MYR': ('ringgit', 'sen'),
+    '$': ('dollar', 'sen'),
+    'USD': ('dollar', 'sen'),
+    '£': ('pound', 'pence'),
+    '€': ('euro', 'sen'),
+}
+
 # Regex
-_date_re = re.compile(r'\b(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{2,4})\b')
+# Capturing groups are named with a per-pattern prefix so the patterns can be
+# combined into a single alternation (see _numeric_re below). Letters are
+# matched with explicit [Xx] classes rather than re.IGNORECASE.
+_date_re = re.compile(r'\b(?P<date_day>\d{1,2})[\/\-\.](?P<date_month>\d{1,2})[\/\-\.](?P<date_year>\d{2,4})\b')
 
 _currency_re = re.compile(
-    r'(RM|\$|£|€|USD|EUR|GBP|MYR)(?:\s?)([\d,]+(?:[\.,]\d{1,2})?)\b',
-    re.IGNORECASE
+    r'(?P<curr_symbol>[Rr][Mm]|\$|£|€|[Uu][Ss][Dd]|[Ee][Uu][Rr]|[Gg][Bb][Pp]|[Mm][Yy][Rr])'
+    r'(?:\s?)(?P<curr_amount>[\d,]+(?:[\.,]\d{1,2})?)\b'
 )
-_decimal_re = re.compile(r'\b(\d+)\.(\d+)\b')
-_dashed_digit_re = re.compile(r'(?<![A-Za-z])([+\d]+(?:-[\d]+)+)(?![A-Za-z])')
-_alnum_re = re.compile(r'\b[\w\-]+\b')
+_decimal_re = re.compile(r'\b(?P<dec_whole>\d+)\.(?P<dec_frac>\d+)\b')
+_dashed_digit_re = re.compile(r'(?<![A-Za-z])(?P<dashed_raw>[+\d]+(?:-[\d]+)+)(?![A-Za-z])')
+# Only tokens containing a digit need spelling out
+_alnum_re = re.compile(r'\b[\w\-]*\d[\w\-]*\b')
 _number_re = re.compile(r'\b\d+\b')
-_number_with_commas_re = re.compile(r'\b\d{1,3}(?:,\d{3})+\b')
-_percentage_re = re.compile(r'\b(\d+(?:\.\d+)?)%')
-_time_re = re.compile(r'\b(\d{1,2})[:\.](\d{2})\s*(?:(am|pm|a\.m\.|p\.m\.|malam|petang))', re.IGNORECASE)
-_time_no_meridian_re = re.compile(r'\b(\d{1,2})[:\.](\d{2})\b(?!\s*(?:am|pm|a\.m\.|p\.m\.|malam|petang))(?!.*%)', re.IGNORECASE)
+_number_with_commas_re = re.compile(r'\b(?P<comma_whole>\d{1,3}(?:,\d{3})+)(?:\.(?P<comma_frac>\d+))?\b')
+_percentage_re = re.compile(r'\b(?P<pct_number>\d+(?:\.\d+)?)%')
+_time_re = re.compile(r'\b(?P<time_hour>\d{1,2})[:\.](?P<time_minute>\d{2})\s*(?:(?P<time_meridian>[AaPp][Mm]|[AaPp]\.[Mm]\.|[Mm][Aa][Ll][Aa][Mm]|[Pp][Ee][Tt][Aa][Nn][Gg]))')
+_time_no_meridian_re = re.compile(r'\b(?P<tnm_hour>\d{1,2})[:\.](?P<tnm_minute>\d{2})\b(?!\s*(?:[AaPp][Mm]|[AaPp]\.[Mm]\.|[Mm][Aa][Ll][Aa][Mm]|[Pp][Ee][Tt][Aa][Nn][Gg]))(?!.*%)')
+
+_drop_plus_dash = str.maketrans('', '', '+-')
+_ascii_letters = frozenset(string.ascii_letters)
 
 
 def is_mixed_alnum(token):
-    return any(c.isalpha() for c in token) and any(c.isdigit() for c in token)
+    # Single pass that stops as soon as both a letter and a digit were seen
+    has_alpha = has_digit = False
+    for c in token:
+        if c.isalpha():
+            has_alpha = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_alpha and has_digit:
+            return True
+    return False
 
 
 def is_only_digits_and_dashes(token):
-    return all(c.isdigit() or c in '+-' for c in token.replace('-', ''))
+    rest = token.translate(_drop_plus_dash)
+    return not rest or rest.isdigit()
+
+
+# Character classes reported by _classify_token
+_HAS_ALPHA, _HAS_DIGIT, _HAS_OTHER = 4, 2, 1
+
+
+def _classify_token(token):
+    """
+    Classify a token's characters in one pass.
+
+    Returns a bitmask of _HAS_ALPHA, _HAS_DIGIT and _HAS_OTHER, where "other"
+    is anything that is not a letter, a digit, '+' or '-'.
+    """
+    kind = 0
+    for c in token:
+        if c.isalpha():
+            kind |= _HAS_ALPHA
+        elif c.isdigit():
+            kind |= _HAS_DIGIT
+        elif c not in '+-':
+            kind |= _HAS_OTHER
+    return kind
 
 
 def normalize_percentage(m):
-    number = m.group(1)
+    number = m.group('pct_number')
     if '.' in number:
         whole, frac = number.split('.')
         # Handle multi-digit decimals by speaking each digit
-        frac_words = ' '.join(num2word(int(digit)) for digit in frac)
+        frac_words = frac.translate(_spell_digits_ms).lstrip()
         return f"{num2word(int(whole))} perpuluhan {frac_words} peratus"
     else:
         return f"{num2word(int(number))} peratus"
 
 
 def normalize_time(m):
-    hour, minute, meridian = m.groups()
+    hour, minute, meridian = m.group('time_hour', 'time_minute', 'time_meridian')
     hour_word = num2word(int(hour))
     minute_word = num2word(int(minute))
 
@@ -75,7 +144,7 @@ def normalize_time(m):
 
 def normalize_time_no_meridian(m):
     """Normalize time without meridian (e.g., 17:30, 09:00)."""
-    hour, minute = m.groups()
+    hour, minute = m.group('tnm_hour', 'tnm_minute')
     hour_int = int(hour)
     minute_int = int(minute)
 
@@ -96,28 +165,17 @@ def normalize_time_no_meridian(m):
 
 
 def normalize_date(m):
-    day, month, year = m.groups()
-    month_name = _months.get(month.lstrip("0"), month)
+    day, month, year = m.group('date_day', 'date_month', 'date_year')
+    # _months has both padded and unpadded keys; out-of-range months are
+    # spelled out like any other number
+    month_name = _months.get(month) or num2word(int(month))
     return f"{num2word(int(day))} {month_name} {num2word(int(year))}"
 
 
 def normalize_currency(m):
-    symbol, amount = m.groups()
+    symbol, amount = m.group('curr_symbol', 'curr_amount')
     amount = amount.replace(",", "")
-    if symbol.upper() == 'RM':
-        unit_main, unit_sub = 'ringgit', 'sen'
-    elif symbol == '$':
-        unit_main, unit_sub = 'dollar', 'sen'
-    elif symbol == '£':
-        unit_main, unit_sub = 'pound', 'pence'
-    elif symbol == '€':
-        unit_main, unit_sub = 'euro', 'sen'
-    elif symbol == 'USD':
-        unit_main, unit_sub = 'dollar', 'sen'
-    elif symbol == 'MYR':
-        unit_main, unit_sub = 'ringgit', 'sen'
-    else:
-        unit_main, unit_sub = 'unit', 'subunit'
+    unit_main, unit_sub = _currency_units.get(symbol.upper(), ('unit', 'subunit'))
 
     if '.' in amount:
         ringgit, sen = amount.split('.')
@@ -129,34 +187,43 @@ def normalize_currency(m):
         return f"{num2word(int(amount))} {unit_main}"
 
 
-def normalize_decimal(m):
-    whole, frac = m.group(1), m.group(2)
+def _decimal_words(whole, frac):
     # Handle multi-digit decimals by speaking each digit
-    frac_words = ' '.join(num2word(int(digit)) for digit in frac)
-    return f"{num2word(int(whole))} perpuluhan {frac_words}"
+    frac_words = frac.translate(_spell_digits_ms).lstrip()
+    return f"{num2word(whole)} perpuluhan {frac_words}"
+
+
+def normalize_decimal(m):
+    whole, frac = m.group('dec_whole', 'dec_frac')
+    return _decimal_words(int(whole), frac)
 
 
 def normalize_number_with_commas(m):
-    """Normalize numbers with commas like 1,000,000 or 7,832."""
-    num_str = m.group(0).replace(',', '')
-    num = int(num_str)
+    """Normalize numbers with commas like 1,000,000, 7,832 or 1,234.56."""
+    whole, frac = m.group('comma_whole', 'comma_frac')
+    num = int(whole.replace(',', ''))
+    if frac is not None:
+        return _decimal_words(num, frac)
     return num2word(num)
 
 
 def normalize_dashed_digits(m):
-    raw = m.group(1)
-    return ' '.join(numbers_mapping_malay.get(ch, ch) for ch in raw if ch in numbers_mapping_malay)
+    return m.group('dashed_raw').translate(_spell_digits_ms).lstrip()
 
 
 def normalize_mixed_alnum(m):
+    # _alnum_re only matches tokens that contain a digit
     token = m.group(0)
-    if is_only_digits_and_dashes(token):
+    kind = _classify_token(token)
+    if not kind & (_HAS_ALPHA | _HAS_OTHER):
+        # Only digits and dashes: same as is_only_digits_and_dashes(token)
         return token
-    if is_mixed_alnum(token):
+    if kind & _HAS_ALPHA:
+        # Letters and digits: same as is_mixed_alnum(token)
         # Handle tokens like v2.3.1 - split on dots and process each part
-        if '.' in token and not re.match(r'^[A-Za-z]', token):
+        if '.' in token and token[0] not in _ascii_letters:
             # Handle cases like 2.3.1 (starts with digit)
-            return ' '.join(numbers_mapping_malay.get(ch, ch.upper()) for ch in token if ch.isalnum())
+            return token.translate(_spell_alnum_ms).lstrip()
         elif '.' in token:
             # Handle cases like v2.3.1 (starts with letter)
             parts = token.split('.')
@@ -167,32 +234,76 @@ def normalize_mixed_alnum(m):
                 elif part.isdigit():
                     result.append(num2word(int(part)))
                 elif part:  # mixed alnum like INV
-                    result.append(' '.join(numbers_mapping_malay.get(ch, ch.upper()) for ch in part if ch.isalnum()))
+                    result.append(part.translate(_spell_alnum_ms).lstrip())
                 if i < len(parts) - 1:  # Add "perpuluhan" between parts
                     result.append("perpuluhan")
             return ' '.join(result)
         else:
-            return ' '.join(numbers_mapping_malay.get(ch, ch.upper()) for ch in token if ch.isalnum())
+            return token.translate(_spell_alnum_ms).lstrip()
     return token
 
 
 def normalize_number(m):
     if len(m.group(0)) > 4:
-        return ' '.join(num2word(int(digit)) for digit in m.group(0))
+        return m.group(0).translate(_spell_digits_ms).lstrip()
     else:
         return num2word(int(m.group(0)))
 
 
+def _pattern_source(*regexes):
+    """Alternation of the regexes' sources with named groups made non-capturing."""
+    return '|'.join(re.sub(r'\(\?P<\w+>', '(?:', regex.pattern) for regex in regexes)
+
+
+# In one leftmost-first scan a decimal or dashed number that starts further
+# left would swallow the start of a higher-priority match ("10-20%",
+# "9-5:30 pm", "1.2.3.4:80"). These variants refuse to continue into a digit
+# run where a higher-priority pattern matches, like the ordered passes did.
+_decimal_scan_re = re.compile(
+    r'\b(?P<dec_whole>\d+)\.(?!%s)(?P<dec_frac>\d+)\b'
+    % _pattern_source(_time_no_meridian_re, _time_re, _percentage_re)
+)
+_dashed_digit_scan_re = re.compile(
+    r'(?<![A-Za-z])(?P<dashed_raw>[+\d]+(?:-(?!%s)[\d]+)+)(?![A-Za-z])'
+    % _pattern_source(_time_no_meridian_re, _time_re, _percentage_re, _decimal_re)
+)
+
+# Dates have the highest priority and get their own pass: in one alternation
+# an earlier-starting dashed number would swallow them ("+60-12-345-6789").
+# The remaining passes in priority order; earlier entries win when several
+# patterns match at the same position.
+_numeric_passes = [
+    ('currency', _currency_re, normalize_currency),
+    ('time_no_meridian', _time_no_meridian_re, normalize_time_no_meridian),
+    ('time', _time_re, normalize_time),
+    ('percentage', _percentage_re, normalize_percentage),
+    ('decimal', _decimal_scan_re, normalize_decimal),
+    ('dashed_digits', _dashed_digit_scan_re, normalize_dashed_digits),
+    ('number_with_commas', _number_with_commas_re, normalize_number_with_commas),
+    ('number', _number_re, normalize_number),
+]
+# Every alternative starts with a digit, '+' (dashed numbers) or the first
+# character of a currency symbol. The lookahead lets the engine skip other
+# positions instead of trying all eight alternatives at each one.
+_numeric_re = re.compile(
+    r'(?=[\d+$£€RrMmUuEeGg])(?:%s)'
+    % '|'.join(f'(?P<{name}>{regex.pattern})' for name, regex, _ in _numeric_passes)
+)
+_numeric_handlers = {name: handler for name, _, handler in _numeric_passes}
+_digit_re = re.compile(r'\d')
+
+
+def _dispatch_numeric(m):
+    return _numeric_handlers[m.lastgroup](m)
+
+
+@lru_cache(maxsize=4096)
 def normalize_malay(text: str) -> str:
     """Main Malay text normalization function."""
-    text = re.sub(_date_re, normalize_date, text)
-    text = re.sub(_currency_re, normalize_currency, text)
-    text = re.sub(_time_no_meridian_re, normalize_time_no_meridian, text)
-    text = re.sub(_time_re, normalize_time, text)
-    text = re.sub(_percentage_re, normalize_percentage, text)
-    text = re.sub(_decimal_re, normalize_decimal, text)
-    text = re.sub(_dashed_digit_re, normalize_dashed_digits, text)
-    text = re.sub(_number_with_commas_re, normalize_number_with_commas, text)
-    text = re.sub(_number_re, normalize_number, text)
-    text = re.sub(_alnum_re, normalize_mixed_alnum, text)
+    # Every numeric and alnum pattern needs a digit; skip both scans on plain
+    # prose
+    if _digit_re.search(text):
+        text = _date_re.sub(normalize_date, text)
+        text = _numeric_re.sub(_dispatch_numeric, text)
+        text = _alnum_re.sub(normalize_mixed_alnum, text)
     return text
@@ -1,14 +1,52 @@
+import importlib
 import re
 import string
-from typing import List, Tuple, Optional
+import sys
+from functools import lru_cache, partial
+from typing import Callable, List, Optional, Sequence, Tuple
 
-from revo_norm.normalizer_en import text_normalize as text_normalizer_en
-from revo_norm.normalizer_ms import normalize_malay as text_normalizer_ms
+# Language code -> (module, function). Modules are imported on first use so
+# an English-only caller never compiles the Malay patterns and vice versa.
+_LANGUAGE_NORMALIZERS = {
+    'en': ('revo_norm.normalizer_en', 'text_normalize'),
+    'ms': ('revo_norm.normalizer_ms', 'normalize_malay'),
+}
+
+
+@lru_cache(maxsize=None)
+def _language_normalizer(language: str):
+    """Return the normalizer for ``language``, importing it on first use."""
+    module_name, function_name = _LANGUAGE_NORMALIZERS[language]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def clear_cache() -> None:
+    """
+    Clear memoized normalizer results.
+
+    Call this after changing module-level tables such as KNOWN_LETTERWISE.
+    normalize_text, normalize_english and normalize_malay each keep up to 4096
+    recent inputs and their outputs alive, whatever their length; calling
+    this also releases that memory, e.g. after a batch of long documents.
+    """
+    normalize_text.cache_clear()
+    expand_acronym.cache_clear()
+    _parse_sound_words_cached.cache_clear()
+    _compile_sound_words.cache_clear()
+    for module_name, function_name in _LANGUAGE_NORMALIZERS.values():
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, function_name).cache_clear()
+
+
+_WHITESPACE_RUN_RE = re.compile(r'\s{2,}')
 
 
 def normalize_whitespace(text: str) -> str:
     """Normalize multiple whitespace to single space and strip."""
-    return re.sub(r'\s{2,}', ' ', text.strip())
+    # A lone tab or newline is kept: insert_comma_after_repeated_words only
+    # treats a literal space as the separator between repeats
+    return _WHITESPACE_RUN_RE.sub(' ', text.strip())
 
 
 def email_to_spoken(email: str) -> str:
@@ -27,7 +65,7 @@ def email_to_spoken(email: str) -> str:
     # Replace hyphen with " dash " in emails
     spoken = spoken.replace("-", " dash ")
 
-    return re.sub(r"\s+", " ", spoken).strip()
+    return " ".join(spoken.split())
 
 
 # Email regex pattern
@@ -49,6 +87,31 @@ def convert_emails_to_spoken(text: str) -> str:
     return _EMAIL_RE.sub(replace_email, text)
 
 
+# Every URL token in one scan: protocols and www first so their letters and
+# punctuation are spoken as a unit, then an optional port colon with digits
+_URL_TOKEN_RE = re.compile(r'https?://|ftp://|www\.?|[./-]|(:)?(\d+)')
+
+_URL_TOKEN_WORDS = {
+    'http://': 'h t t p colon slash slash ',
+    'https://': 'h t t p colon slash slash ',
+    'ftp://': 'f t p colon slash slash ',
+    'www': 'w w w dot ',
+    'www.': 'w w w dot ',
+    '.': ' dot ',
+    '/': ' slash ',
+    '-': ' dash ',
+}
+
+
+def _speak_url_token(match):
+    digits = match.group(2)
+    if digits is None:
+        return _URL_TOKEN_WORDS[match.group(0)]
+    # Numbers are read digit by digit (ports, IP addresses)
+    spoken = ' '.join(digits)
+    return f' colon {spoken}' if match.group(1) else spoken
+
+
 def url_to_spoken(url: str) -> str:
     """
     Convert a URL/website into a spoken-friendly form for TTS.
@@ -57,42 +120,10 @@ def url_to_spoken(url: str) -> str:
         'www.google.com' -> 'w w w dot google dot com'
         'http://192.168.1.1:8080/path' -> 'h t t p colon slash slash one nine two...'
     """
-    spoken = url
-
-    # Replace protocol FIRST (before touching numbers)
-    spoken = re.sub(r'https?://', 'h t t p colon slash slash ', spoken)
-    spoken = re.sub(r'ftp://', 'f t p colon slash slash ', spoken)
-
-    # Replace www
-    spoken = re.sub(r'www\.?', 'w w w dot ', spoken)
-
-    # Handle port numbers separately (before general processing)
-    def replace_port(match):
-        port = match.group(1)
-        port_digits = ' '.join(list(port))
-        return f' colon {port_digits}'
-    spoken = re.sub(r':(\d+)', replace_port, spoken)
-
-    # Replace remaining dots with " dot "
-    spoken = spoken.replace(".", " dot ")
-
-    # Replace slashes with " slash "
-    spoken = spoken.replace("/", " slash ")
-
-    # Replace remaining numbers with digit-by-digit speaking (for IP addresses)
-    def speak_number_digits(match):
-        num = match.group(0)
-        return ' '.join(list(num))
-
-    spoken = re.sub(r'\d+', speak_number_digits, spoken)
-
-    # Replace hyphens with " dash "
-    spoken = spoken.replace("-", " dash ")
+    spoken = _URL_TOKEN_RE.sub(_speak_url_token, url)
 
     # Clean up extra spaces
-    spoken = re.sub(r'\s+', ' ', spoken).strip()
-
-    return spoken
+    return ' '.join(spoken.split())
 
 
 # URL regex pattern - matches www., http://, https://, ftp://, IPs, domains, and ports
@@ -115,51 +146,78 @@ def convert_urls_to_spoken(text: str) -> str:
     return _URL_RE.sub(replace_url, text)
 
 
+_LETTER_PERIOD_RE = re.compile(r'\b(?:[A-Za-z]\.){2,}')
+
+
 def replace_letter_period_sequences(text: str) -> str:
     """Replace letter period sequences like 'I.B.M.' with 'I B M'."""
     def replacer(match):
         cleaned = match.group(0).rstrip('.')
         letters = cleaned.split('.')
         return ' '.join(letters)
-    return re.sub(r'\b(?:[A-Za-z]\.){2,}', replacer, text)
+    return _LETTER_PERIOD_RE.sub(replacer, text)
+
+
+_REFERENCE_NUMBER_RE = re.compile(r'([.!?,\\\'"\)\]])(\d+)(?=\s|$)')
 
 
 def remove_inline_reference_numbers(text: str) -> str:
     """Remove reference numbers after punctuation (e.g., 'word1.' -> 'word.')."""
-    pattern = r'([.!?,\\\'"\)\]])(\d+)(?=\s|$)'
-    return re.sub(pattern, r'\1', text)
+    return _REFERENCE_NUMBER_RE.sub(r'\1', text)
+
+
+_VOWELS = frozenset("AEIOUaeiou")
 
 
 def is_pronounceable(acronym: str) -> bool:
     """Check if an acronym is pronounceable based on vowel count."""
-    vowels = set("AEIOUaeiou")
-    return sum(ch in vowels for ch in acronym) >= 2
+    vowel_count = 0
+    for ch in acronym:
+        if ch in _VOWELS:
+            vowel_count += 1
+            if vowel_count == 2:
+                return True
+    return False
 
 
 KNOWN_LETTERWISE = {"UOB", "UIA", "UITM", "KLIA", "KLIA2"}
 
 
+@lru_cache(maxsize=4096)
 def expand_acronym(acronym: str) -> str:
     """Expand an acronym into spoken form."""
-    if acronym in KNOWN_LETTERWISE:
-        return " ".join(list(acronym))
-    if is_pronounceable(acronym) and len(acronym) > 3:
+    if (
+        len(acronym) > 3
+        and acronym not in KNOWN_LETTERWISE
+        and is_pronounceable(acronym)
+    ):
         return acronym
-    return " ".join(list(acronym))
+    return " ".join(acronym)
+
+
+# Same matches as r'\b[A-Z]{2,}\b'. Starting with a literal [A-Z] lets the
+# engine jump between capitals instead of testing a word boundary at every
+# position; the lookbehind restores the leading boundary check.
+_ACRONYM_RE = re.compile(r'[A-Z](?<=\b[A-Z])[A-Z]+\b')
+
+
+def _expand_acronym_match(match):
+    return expand_acronym(match.group(0))
 
 
 def expand_capitalized_initialisms(text: str) -> str:
     """Expand capitalized acronyms in text."""
-    def replacer(match):
-        acronym = match.group(0)
-        return expand_acronym(acronym)
-    return re.sub(r'\b([A-Z]{2,})\b', replacer, text)
+    return _ACRONYM_RE.sub(_expand_acronym_match, text)
+
+
+# Same splits as r'(?<=[.!?])\s+(?=[A-Z])', but starting on a whitespace
+# character lets the engine skip straight to candidate positions
+_SENTENCE_END_RE = re.compile(r'\s(?<=[.!?]\s)\s*(?=[A-Z])')
 
 
 def split_into_sentences(text: str) -> List[str]:
     """Split text into sentences using basic regex."""
-    sentence_endings = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
-    return [s.strip() for s in sentence_endings.split(text) if s.strip()]
+    return [s for s in map(str.strip, _SENTENCE_END_RE.split(text)) if s]
 
 
 def parse_sound_word_field(user_input: str) -> List[Tuple[str, str]]:
@@ -175,80 +233,187 @@ def parse_sound_word_field(user_input: str) -> List[Tuple[str, str]]:
     return result
 
 
-def smart_remove_sound_words(text: str, sound_words: List[Tuple[str, str]]) -> str:
-    """Remove or replace sound words like [laughter], [applause] from text."""
+@lru_cache(maxsize=16)
+def _parse_sound_words_cached(user_input: str) -> Tuple[Tuple[str, str], ...]:
+    """parse_sound_word_field for the hot path; the field rarely changes between calls."""
+    return tuple(parse_sound_word_field(user_input))
+
+
+# camelCase boundaries, comma runs and whitespace runs never overlap, so they
+# are cleaned up in one scan: a run of commas and whitespace becomes ',' or
+# ', ' (when whitespace follows the last comma), other runs become one space
+_SEPARATOR_CLEANUP_RE = re.compile(r'([a-z])(?=[A-Z])|[,\s]*,(\s*)|\s{2,}')
+_LEADING_COMMA_RE = re.compile(r'(^|[\.!\?]\s*),+')
+_COMMA_BEFORE_PUNCT_RE = re.compile(r',+\s*([\.!\?])')
+
+
+def _clean_separator(match):
+    lower = match.group(1)
+    if lower is not None:
+        return lower + ' '
+    trailing = match.group(2)
+    if trailing is None:
+        return ' '
+    return ', ' if trailing else ','
+
+
+@lru_cache(maxsize=64)
+def _compile_sound_words(sound_words: Tuple[Tuple[str, str], ...]) -> List[Callable[[str], str]]:
+    """Build the substitution steps for a sound word list, in list order."""
+    substitutions: List[Callable[[str], str]] = []
     for pattern, replacement in sound_words:
+        escaped = re.escape(pattern)
         if replacement:
-            text = re.sub(
-                r'(?i)(%s)([' r"'\u2019`s?])" % re.escape(pattern),
-                lambda m: replacement + "'s" if m.group(2) else replacement,
-                text
-            )
+            substitutions.append(partial(
+                re.compile(r'(?i)(%s)([' r"'\u2019`s?])" % escaped).sub,
+                lambda m, replacement=replacement: (
+                    replacement + "'s" if m.group(2) else replacement
+                ),
+            ))
             if all(char in "-—-" for char in pattern.strip()):
-                text = re.sub(re.escape(pattern), replacement, text)
+                # Case-sensitive literal; only a backslash would make the
+                # replacement a template
+                if '\\' in replacement:
+                    substitutions.append(partial(re.compile(escaped).sub, replacement))
+                else:
+                    substitutions.append(partial(_replace_literal, pattern, replacement))
             else:
-                text = re.sub(
-                    r'\b%s\b' % re.escape(pattern),
-                    replacement,
-                    text,
-                    flags=re.IGNORECASE
+                substitutions.append(
+                    partial(re.compile(r'\b%s\b' % escaped, re.IGNORECASE).sub, replacement)
                 )
+        elif pattern.isascii() and not any(map(str.isalpha, pattern)):
+            # Without letters, case-insensitive matching is plain matching
+            substitutions.append(partial(_replace_literal, pattern, ''))
         else:
-            text = re.sub(
-                r'%s' % re.escape(pattern),
-                '',
-                text,
-                flags=re.IGNORECASE
-            )
-
-    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-    text = re.sub(r'([,\s]+,)+', ',', text)
-    text = re.sub(r',\s*,+', ',', text)
-    text = re.sub(r'\s{2,}', ' ', text)
-    text = re.sub(r'(\s+,|,\s+)', ', ', text)
-    text = re.sub(r'(^|[\.!\?]\s*),+', r'\1', text)
-    text = re.sub(r',+\s*([\.!\?])', r'\1', text)
+            substitutions.append(partial(re.compile(escaped, re.IGNORECASE).sub, ''))
+    return substitutions
+
+
+def _replace_literal(old: str, new: str, text: str) -> str:
+    return text.replace(old, new)
+
+
+def smart_remove_sound_words(text: str, sound_words: Sequence[Tuple[str, str]]) -> str:
+    """Remove or replace sound words like [laughter], [applause] from text."""
+    for substitute in _compile_sound_words(tuple(map(tuple, sound_words))):
+        text = substitute(text)
+
+    text = _SEPARATOR_CLEANUP_RE.sub(_clean_separator, text)
+    text = _LEADING_COMMA_RE.sub(r'\1', text)
+    text = _COMMA_BEFORE_PUNCT_RE.sub(r'\1', text)
     return text.strip()
 
 
+@lru_cache(maxsize=None)
+def _repeated_words_re(min_repeat: int) -> "re.Pattern[str]":
+    return re.compile(r'\b(?P<word>\w+)\b(?: \1){' + str(min_repeat) + r',}', re.IGNORECASE)
+
+
 def insert_comma_after_repeated_words(text: str, min_repeat: int = 3) -> str:
     """Insert comma after repeated words (e.g., 'test test test test' -> 'test test test, test')."""
-    pattern = r'\b(?P<word>\w+)\b(?: \1){' + str(min_repeat) + r',}'
+    # Cheap necessary conditions before the backreference scan: a match needs
+    # min_repeat single spaces, and its middle repeats are whole space-separated
+    # tokens, so with min_repeat >= 3 two adjacent tokens must be equal. str.lower
+    # only agrees with the regex's case folding on ASCII text.
+    if text.count(' ') < min_repeat:
+        return text
+    if min_repeat >= 3 and text.isascii():
+        words = text.lower().split(' ')
+        if not any(a == b for a, b in zip(words, words[1:])):
+            return text
 
     def replacer(match):
         phrase = match.group(0)
         words = phrase.split()
         return ' '.join(words[:-1]) + ', ' + words[-1]
 
-    return re.sub(pattern, replacer, text, flags=re.IGNORECASE)
+    return _repeated_words_re(min_repeat).sub(replacer, text)
 
 
-def apply_pronunciation_overrides(text: str) -> str:
-    """Apply pronunciation overrides for specific words and phrases."""
-    text = re.sub(r'\btwenty-three\b', 'twenty tree', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bthree\b', 'three', text, flags=re.IGNORECASE)
-    text = re.sub(r'\btwenty-eight\b', 'twenty, eight', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bcut-off\b', 'kad off', text, flags=re.IGNORECASE)
-    text = re.sub(r'\beighty-eight\b', 'eighty eight', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bNumber\b', 'number', text, flags=re.IGNORECASE)
-    text = re.sub(r'\ba/l\b', 'anak lelaki', text, flags=re.IGNORECASE)
-    text = re.sub(r'\ba/p\b', 'anak perempuan', text, flags=re.IGNORECASE)
-    text = re.sub(r'\b1Malaysia\b', 'satu malaysia', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bNo\.\b', 'number', text, flags=re.IGNORECASE)
+_PRONUNCIATION_OVERRIDES = [
+    (r'twenty-three', 'twenty tree'),
+    (r'three', 'three'),
+    (r'twenty-eight', 'twenty, eight'),
+    (r'cut-off', 'kad off'),
+    (r'eighty-eight', 'eighty eight'),
+    (r'Number', 'number'),
+    (r'a/l', 'anak lelaki'),
+    (r'a/p', 'anak perempuan'),
+    (r'1Malaysia', 'satu malaysia'),
+    (r'No\.', 'number'),
     # Don't replace "/" here - let date regex handle dates like 12/03/2025
+]
+
+_UNIT_OVERRIDES = [
+    ("mg", "milligram"),
+    ("kg", "kilogram"),
+    ("GB", "gigabyte"),
+    ("hb", "haribulan"),
+]
+
+# One capturing group per entry, in priority order; m.lastindex picks the
+# replacement, which also covers case-insensitive matches such as the Kelvin
+# sign that a lowercased dict key would miss. Units share the scan: no
+# override key can overlap a "<digits> <unit>" match, so a single pass gives
+# the same result as running the two rule sets one after the other. The
+# lookahead on the possible first characters lets the engine skip ahead
+# instead of trying every alternative at every position.
+_OVERRIDE_RE = re.compile(
+    r'(?=[\d%s])(?:\b(?:%s)\b|(\d+)\s*(?:%s)\b)' % (
+        re.escape(''.join(sorted({pattern[0] for pattern, _ in _PRONUNCIATION_OVERRIDES}))),
+        '|'.join(f'({pattern})' for pattern, _ in _PRONUNCIATION_OVERRIDES),
+        '|'.join(f'({unit})' for unit, _ in _UNIT_OVERRIDES),
+    ),
+    re.IGNORECASE
+)
+_OVERRIDE_WORDS = [replacement for _, replacement in _PRONUNCIATION_OVERRIDES]
+_UNIT_WORDS = [spoken for _, spoken in _UNIT_OVERRIDES]
+# Group holding the number in front of a unit
+_UNIT_NUMBER_GROUP = len(_OVERRIDE_WORDS) + 1
+
 
-    unit_map = {
-        "mg": "milligram",
-        "kg": "kilogram",
-        "GB": "gigabyte",
-        "hb": "haribulan"
+def _speak_override(match):
+    index = match.lastindex
+    if index < _UNIT_NUMBER_GROUP:
+        return _OVERRIDE_WORDS[index - 1]
+    return f'{match.group(_UNIT_NUMBER_GROUP)} {_UNIT_WORDS[index - _UNIT_NUMBER_GROUP - 1]}'
+
+
+def apply_pronunciation_overrides(text: str) -> str:
+    """Apply pronunciation overrides for specific words and phrases."""
+    return _OVERRIDE_RE.sub(_speak_override, text)
+
+
+def _special_words(percent_word: str) -> dict:
+    return {
+        char: f' {replacement} '
+        for char, replacement in {
+            '&': 'and',
+            '+': 'plus',
+            '=': 'equals',
+            '@': 'at',
+            '#': 'hash',
+            '*': 'star',
+            '%': percent_word,
+            '$': 'dollar',
+            'EUR': 'euro',
+            'GBP': 'pound',
+            '©': 'copyright',
+            '®': 'registered',
+            '™': 'trademark',
+            '<': 'less than',
+            '>': 'greater than',
+            '|': 'bar',
+            '~': 'tilde',
+            '^': 'caret',
+        }.items()
     }
 
-    for unit, spoken in unit_map.items():
-        pattern = rf'(\d+)\s*{unit}\b'
-        text = re.sub(pattern, rf'\1 {spoken}', text, flags=re.IGNORECASE)
 
-    return text
+# No spoken form contains another key, so one alternation pass gives the same
+# result as replacing the keys one after another
+_SPECIAL_WORDS = {'en': _special_words('percent'), 'ms': _special_words('peratus')}
+_SPECIAL_RE = re.compile('|'.join(map(re.escape, _SPECIAL_WORDS['en'])))
 
 
 def special_replace(text: str, language: str = 'en') -> str:
@@ -257,37 +422,16 @@ def special_replace(text: str, language: str = 'en') -> str:
     This function replaces special characters with spoken equivalents.
     """
     # Language-specific replacements
-    percent_word = 'percent' if language == 'en' else 'peratus'
-
-    replacements = {
-        '&': 'and',
-        '+': 'plus',
-        '=': 'equals',
-        '@': 'at',
-        '#': 'hash',
-        '*': 'star',
-        '%': percent_word,
-        '$': 'dollar',
-        'EUR': 'euro',
-        'GBP': 'pound',
-        '©': 'copyright',
-        '®': 'registered',
-        '™': 'trademark',
-        '<': 'less than',
-        '>': 'greater than',
-        '|': 'bar',
-        '~': 'tilde',
-        '^': 'caret',
-    }
-
-    for char, replacement in replacements.items():
-        text = text.replace(char, f' {replacement} ')
+    replacements = _SPECIAL_WORDS['en' if language == 'en' else 'ms']
+    text = _SPECIAL_RE.sub(lambda m: replacements[m.group(0)], text)
 
     # Clean up multiple spaces
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return ' '.join(text.split())
 
 
+# Datasets and TTS front ends repeat the same lines a lot; every argument is a
+# str or bool, so whole calls can be memoized
+@lru_cache(maxsize=4096)
 def normalize_text(
     text: str,
     language: str = 'en',
@@ -311,43 +455,50 @@ def normalize_text(
         Normalized text string
     """
     text = text.strip()
-    if not text or len(text) == 0:
+    if not text:
         return ""
 
     # Convert URLs and emails FIRST (before language-specific normalization)
-    # This prevents IP addresses in URLs from being processed as decimals
-    text = convert_urls_to_spoken(text)
-    text = convert_emails_to_spoken(text)
+    # This prevents IP addresses in URLs from being processed as decimals.
+    # Every URL match contains a dot and every email an '@', so a substring
+    # check skips the regex scan on plain text
+    if '.' in text:
+        text = convert_urls_to_spoken(text)
+    if '@' in text:
+        text = convert_emails_to_spoken(text)
 
     # Apply pronunciation overrides
     if apply_pronunciation_overrides_flag:
         text = apply_pronunciation_overrides(text)
+    overridden = text
 
-    # Language-specific normalization
-    if language == 'en':
-        text = text_normalizer_en(text)
-    elif language == 'ms':
-        text = text_normalizer_ms(text)
+    # Language-specific normalization. normalize_text is memoized itself, so
+    # call past the per-language cache rather than hold a second copy of
+    # every input and output there
+    if language in _LANGUAGE_NORMALIZERS:
+        text = _language_normalizer(language).__wrapped__(text)
 
     # Remove sound words
     if sound_words_field and sound_words_field.strip():
-        sound_words = parse_sound_word_field(sound_words_field)
+        sound_words = _parse_sound_words_cached(sound_words_field)
         if sound_words:
             text = smart_remove_sound_words(text, sound_words)
 
-    # Expand acronyms
-    text = expand_capitalized_initialisms(text)
+    # Expand acronyms (only possible when there are uppercase letters)
+    if not text.islower():
+        text = expand_capitalized_initialisms(text)
 
     # Normalize spacing
     if normalize_spacing:
         text = normalize_whitespace(text)
 
     # Fix letter period sequences
-    if fix_dot_letters:
+    if fix_dot_letters and '.' in text:
         text = replace_letter_period_sequences(text)
 
-    # Apply pronunciation overrides again
-    if apply_pronunciation_overrides_flag:
+    # Apply pronunciation overrides again. The overrides are idempotent, so
+    # this only matters when a later stage changed the text
+    if apply_pronunciation_overrides_flag and text != overridden:
         text = apply_pronunciation_overrides(text)
 
     # Insert comma after repeated words
@@ -357,3 +508,59 @@ def normalize_text(
     text = special_replace(text, language)
 
     return text
+
+
+def normalize_text_batch(
+    texts: List[str],
+    language: str = 'en',
+    normalize_spacing: bool = True,
+    fix_dot_letters: bool = True,
+    sound_words_field: str = "",
+    apply_pronunciation_overrides_flag: bool = True,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Normalize many texts with the same options.
+
+    The sound words field is parsed and compiled once for the whole batch
+    (once per worker process when ``max_workers`` is set). Normalization is
+    CPU-bound Python and ``re`` holds the GIL, so parallelism uses processes
+    rather than threads; on spawn-based platforms call this from under an
+    ``if __name__ == "__main__":`` guard.
+
+    Args:
+        texts: The input texts to normalize
+        language: Language code ('en' for English, 'ms' for Malay)
+        normalize_spacing: Whether to normalize whitespace
+        fix_dot_letters: Whether to fix letter period sequences
+        sound_words_field: Sound words to remove (newline-separated, use '=>' for replacements)
+        apply_pronunciation_overrides_flag: Whether to apply pronunciation overrides
+        max_workers: Number of worker processes; None or 1 runs in this process
+
+    Returns:
+        Normalized text strings, in input order
+
+    Raises:
+        ValueError: If max_workers is less than 1
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    normalize = partial(
+        normalize_text,
+        language=language,
+        normalize_spacing=normalize_spacing,
+        fix_dot_letters=fix_dot_letters,
+        sound_words_field=sound_words_field,
+        apply_pronunciation_overrides_flag=apply_pronunciation_overrides_flag,
+    )
+    if max_workers is None or max_workers == 1 or len(texts) <= 1:
+        return list(map(normalize, texts))
+
+    # Imported here: concurrent.futures.process pulls in multiprocessing,
+    # which would otherwise add to every `import revo_norm`
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Large chunks keep inter-process overhead small relative to the work
+    chunksize = max(1, len(texts) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(normalize, texts, chunksize=chunksize))
@@ -0,0 +1,12 @@
+import revo_norm
+
+
+class TestPackageExports:
+    def test_dir_lists_lazy_normalizers(self):
+        names = dir(revo_norm)
+        assert "normalize_english" in names
+        assert "normalize_malay" in names
+
+    def test_all_names_resolve(self):
+        for name in revo_norm.__all__:
+            assert getattr(revo_norm, name) is not None
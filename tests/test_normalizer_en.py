@@ -0,0 +1,62 @@
+import pytest
+
+from revo_norm.normalizer_en import text_normalize
+
+
+class TestNumericPriority:
+    """The single numeric scan must agree with running the passes in order."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("1,234.56", "one thousand, two hundred and thirty-four point five six"),
+            ("$1,000.99", "$one thousand point nine nine"),
+            ("1,000,000", "one million"),
+        ],
+    )
+    def test_comma_decimals(self, text, expected):
+        assert text_normalize(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("RM1,000.99", "one thousand ringgit ninety-nine cent"),
+            ("RM 1,000.50", "one thousand ringgit fifty cent"),
+        ],
+    )
+    def test_currency_with_cents(self, text, expected):
+        assert text_normalize(text) == expected
+
+    def test_phone_number_keeps_date_priority(self):
+        assert text_normalize("+60-12-345-6789") == (
+            "+sixtieth of December, three hundred and forty-five-"
+            "six thousand, seven hundred and eighty-nine"
+        )
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("10-20%", "ten-twenty percent"),
+            ("9-5:30 pm", "nine-five thirty p m"),
+            ("1.2.3.4:80", "one point two.three.four eighty"),
+        ],
+    )
+    def test_earlier_match_does_not_swallow_higher_priority(self, text, expected):
+        assert text_normalize(text) == expected
+
+
+class TestWordExpansion:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("I'm here", "I am here"),
+            ("Mr. Smith can't go", "mister Smith cannot go"),
+            # re.IGNORECASE matches these against 'i' and 's'
+            ("İ'm here", "I am here"),
+            ("ıt's fine", "it is fine"),
+            ("He iſn't here", "He is not here"),
+            ("Meet ſt. Paul", "Meet saint Paul"),
+        ],
+    )
+    def test_expands_contractions_and_abbreviations(self, text, expected):
+        assert text_normalize(text) == expected
@@ -0,0 +1,51 @@
+import pytest
+
+from revo_norm.normalizer_ms import normalize_malay, num2word
+
+
+class TestNumericPriority:
+    """The single numeric scan must agree with running the passes in order."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("1,234.56", "seribu dua ratus tiga puluh empat perpuluhan lima enam"),
+            ("1,000,000", "satu juta"),
+        ],
+    )
+    def test_comma_decimals(self, text, expected):
+        assert normalize_malay(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("RM1,000.99", "seribu ringgit sembilan puluh sembilan sen"),
+            ("$1,000.99", "seribu dollar sembilan puluh sembilan sen"),
+        ],
+    )
+    def test_currency_with_cents(self, text, expected):
+        assert normalize_malay(text) == expected
+
+    def test_phone_number_keeps_date_priority(self):
+        assert normalize_malay("+60-12-345-6789") == (
+            "+enam puluh Disember tiga ratus empat puluh lima-"
+            "enam ribu tujuh ratus lapan puluh sembilan"
+        )
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("10-20%", "sepuluh-dua puluh peratus"),
+            ("9-5:30 pm", "sembilan-lima tiga puluh p m"),
+            ("1.2.3.4:80", "satu perpuluhan dua.tiga.empat lapan puluh"),
+        ],
+    )
+    def test_earlier_match_does_not_swallow_higher_priority(self, text, expected):
+        assert normalize_malay(text) == expected
+
+
+class TestNum2Word:
+    def test_int_and_float_are_cached_separately(self):
+        assert num2word(1) == "satu"
+        assert num2word(1.0) == "satu perpuluhan kosong"
+        assert num2word(1) == "satu"
@@ -0,0 +1,47 @@
+import pytest
+
+from revo_norm import normalize_text, normalize_text_batch
+from revo_norm.text_normalizer import normalize_whitespace
+
+
+class TestNormalizeWhitespace:
+    def test_collapses_runs(self):
+        assert normalize_whitespace("  hello\t\t\nworld   test  ") == "hello world test"
+
+    def test_keeps_single_separators(self):
+        assert normalize_whitespace("hello\tworld\nagain") == "hello\tworld\nagain"
+
+    def test_line_broken_repeats_get_no_comma(self):
+        text = "Tolong\ntolong tolong tolong saya"
+        assert normalize_text(text, language="ms") == "Tolong tolong tolong tolong saya"
+
+
+class TestNormalizeTextBatch:
+    TEXTS = [
+        "Meeting at 3:30 pm on 15/08/2025",
+        "Email user@example.com for info",
+        "",
+        "KLIA test test test test",
+        "Price: RM100.50",
+    ]
+    OPTIONS = {"sound_words_field": "[laughter]", "fix_dot_letters": False}
+
+    def expected(self, language):
+        return [normalize_text(text, language=language, **self.OPTIONS) for text in self.TEXTS]
+
+    @pytest.mark.parametrize("language", ["en", "ms"])
+    def test_matches_normalize_text(self, language):
+        result = normalize_text_batch(self.TEXTS, language=language, **self.OPTIONS)
+        assert result == self.expected(language)
+
+    def test_matches_normalize_text_with_workers(self):
+        result = normalize_text_batch(self.TEXTS, max_workers=2, **self.OPTIONS)
+        assert result == self.expected("en")
+
+    def test_empty_batch(self):
+        assert normalize_text_batch([], max_workers=2) == []
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_rejects_non_positive_workers(self, max_workers):
+        with pytest.raises(ValueError):
+            normalize_text_batch(self.TEXTS, max_workers=max_workers)